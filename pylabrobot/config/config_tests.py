@@ -4,7 +4,7 @@ from pathlib import Path
 
 from pylabrobot import load_config
 from pylabrobot.config.config import Config
-from pylabrobot.config.formats import ConfigLoader, ConfigSaver
+from pylabrobot.config.formats import ConfigLoader, ConfigSaver, MultiLoader
 from pylabrobot.config.formats.ini_config import IniLoader, IniSaver
 from pylabrobot.config.formats.json_config import (
   JsonLoader,
@@ -43,6 +43,39 @@ class ConfigTests(unittest.TestCase):
     for rdr, wr, fp in cases:
       self.run_file_reader_writer_test(rdr, wr, tmp_path / fp, fake_config)
 
+  def test_file_reader_caches_until_file_changes(self):
+    tmp_path: Path = Path(tempfile.mkdtemp())
+    fp = tmp_path / "fake_config.json"
+    writer = FileWriter(format_saver=JsonSaver())
+    reader = FileReader(format_loader=JsonLoader())
+
+    writer.write(fp, Config(logging=Config.Logging(log_dir=tmp_path / "logs")))
+    cfg1 = reader.read(fp)
+    assert reader.read(str(fp)) == cfg1
+
+    # mutating a returned config does not affect later (cached) reads
+    cfg1.logging.log_dir = tmp_path / "mutated"
+    assert reader.read(fp).logging.log_dir == tmp_path / "logs"
+
+    new_config = Config(logging=Config.Logging(log_dir=tmp_path / "other_logs"))
+    writer.write(fp, new_config)
+    cfg2 = reader.read(fp)
+    assert cfg2 is not cfg1
+    assert cfg2 == new_config
+
+  def test_multi_loader(self):
+    tmp_path: Path = Path(tempfile.mkdtemp())
+    fake_config = Config(
+      logging=Config.Logging(
+        log_dir=tmp_path / "logs",
+      )
+    )
+    multi_loader = MultiLoader([IniLoader(), JsonLoader()])
+    for saver, fp in ((IniSaver(), "fake_config.ini"), (JsonSaver(), "fake_config.json")):
+      self.run_file_reader_writer_test(multi_loader, saver, tmp_path / fp, fake_config)
+    # no matching extension: fall back to trying every loader
+    self.run_file_reader_writer_test(multi_loader, JsonSaver(), tmp_path / "config", fake_config)
+
   def test_load_config_creates_default(self):
     cwd = Path.cwd()
     test_path = cwd / "test_config.ini"
@@ -1,7 +1,7 @@
 """ConfigLoader and ConfigSaver load and save configs from and to IO streams."""
 
 from abc import ABC, abstractmethod
-from typing import IO, List
+from typing import IO, Dict, List
 
 from pylabrobot.config.config import Config
 
@@ -27,16 +27,32 @@ class ConfigSaver(ABC):
 
 
 class MultiLoader(ConfigLoader):
-  """A ConfigLoader that loads from multiple ConfigLoaders."""
+  """A ConfigLoader that loads from multiple ConfigLoaders.
+
+  If the stream has a file name whose extension matches one of the loaders, that loader is used
+  directly. Otherwise, each loader is tried in turn.
+  """
 
   def __init__(self, loaders: List[ConfigLoader]):
     self.loaders = loaders
+    self._loader_by_extension: Dict[str, ConfigLoader] = {}
+    for loader in loaders:
+      self._loader_by_extension.setdefault(loader.extension, loader)
 
   # Unknown what the Exception will be when trying to load the stream so catch all and ignore.
   def load(self, r: IO) -> Config:
+    name = getattr(r, "name", None)
+    if isinstance(name, str):
+      _, dot, ext = name.rpartition(".")
+      loader = self._loader_by_extension.get(ext) if dot else None
+      if loader is not None:
+        return loader.load(r)
+
+    start = r.tell() if r.seekable() else None
     for loader in self.loaders:
       try:
         return loader.load(r)
       except Exception:
-        pass
+        if start is not None:
+          r.seek(start)
     raise ValueError("No loader could load file.")
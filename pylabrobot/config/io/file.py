@@ -1,19 +1,40 @@
+import copy
+import os
 from pathlib import Path
-from typing import Union
+from typing import Dict, Tuple, Union
 
 from pylabrobot.config.config import Config
+from pylabrobot.config.formats import ConfigLoader
 from pylabrobot.config.io import ConfigReader, ConfigWriter
 
 
 class FileReader(ConfigReader):
-  """A ConfigReader that reads from a file."""
+  """A ConfigReader that reads from a file.
+
+  Parsed configs are cached per path and reused as long as the file's modification time and size
+  are unchanged, so repeated reads of the same file skip opening and parsing it. Each read returns
+  its own copy, so callers may mutate the result.
+  """
 
   encoding = "utf-8"
 
+  def __init__(self, format_loader: ConfigLoader):
+    super().__init__(format_loader=format_loader)
+    self._cache: Dict[str, Tuple[Tuple[int, int], Config]] = {}
+
   def read(self, r: Union[str, Path]) -> Config:
     """Read a Config object from a file."""
-    with open(r, self.open_mode, encoding=self.encoding) as f:
-      return self.format_loader.load(f)
+    path = os.fspath(r)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = self._cache.get(path)
+    if cached is not None and cached[0] == key:
+      return copy.deepcopy(cached[1])
+
+    with open(path, self.open_mode, encoding=self.encoding) as f:
+      cfg = self.format_loader.load(f)
+    self._cache[path] = (key, cfg)
+    return copy.deepcopy(cfg)
 
 
 class FileWriter(ConfigWriter):
@@ -1,4 +1,3 @@
-import inspect
 import json
 import os
 import traceback
@@ -219,9 +218,7 @@ def list_resources():
 
 @app.route("/resource/<resource_id>")
 def resource(resource_id):
-  resource_classes = [c[0] for c in inspect.getmembers(resources_module)]
-
-  if resource_id not in resource_classes:
+  if resource_id not in vars(resources_module):
     return jsonify({"error": f"Resource '{resource_id}' not found."})
 
   resource_class = getattr(resources_module, resource_id)
@@ -126,7 +126,7 @@ class Cytomat(IncubatorBackend):
   def _site_to_firmware_string(self, site: PlateHolder) -> str:
     rack = cast(PlateCarrier, site.parent)
     rack_idx = self._racks.index(rack)
-    site_idx = next(idx for idx, s in rack.sites.items() if s == site)
+    site_idx = rack.sites.index(site)
 
     if self.model in [CytomatType.C2C_425]:
       return f"{str(rack_idx).zfill(2)} {str(site_idx).zfill(2)}"
@@ -68,7 +68,7 @@ class Incubator(Machine, Resource):
 
   def get_site_by_plate_name(self, plate_name: str) -> PlateHolder:
     for rack in self._racks:
-      for site in rack.sites.values():
+      for site in rack.sites:
         if site.resource is not None and site.resource.name == plate_name:
           return site
     raise ResourceNotFoundError(f"Plate {plate_name} not found in incubator '{self.name}'")
@@ -178,7 +178,7 @@ class Incubator(Machine, Resource):
 
     header = [f"Rack {i}" for i in range(len(self._racks))]
     sites = [
-      [site.resource.name if site.resource else "empty" for site in rack.sites.values()]
+      [site.resource.name if site.resource else "empty" for site in rack.sites]
       for rack in self._racks
     ]
     return create_pretty_table(header, *sites)
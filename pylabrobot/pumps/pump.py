@@ -1,5 +1,5 @@
 import asyncio
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from pylabrobot.machines.machine import Machine
 
@@ -96,6 +96,32 @@ class Pump(Machine):
     else:
       raise ValueError("Calibration mode not recognized.")
 
+  async def pump_volumes(self, speed: Union[float, int], volumes: Sequence[Union[float, int]]):
+    """Pump a sequence of volumes back to back at the specified speed. All volumes are validated
+    before the pump is started, so an invalid volume does not leave the sequence partially pumped.
+    Note that this function requires the pump to be calibrated at the input speed.
+
+    Only calibration modes that wait for each volume to be pumped (duration) are supported: in
+    revolutions mode, `run_revolutions` returns as soon as the command is sent, so the volumes
+    would overlap.
+
+    Args:
+      speed: speed in rpm/pump-specific units.
+      volumes: volumes to pump, in order.
+    """
+
+    if self.calibration is None:
+      raise TypeError(
+        "Pump is not calibrated. Volume based pumping and related functions unavailable."
+      )
+    if self.calibration.calibration_mode != "duration":
+      raise ValueError("pump_volumes requires a duration calibration.")
+    if any(volume < 0 for volume in volumes):
+      raise ValueError("Volume must be positive.")
+
+    for volume in volumes:
+      await self.pump_volume(speed=speed, volume=volume)
+
   async def halt(self):
     """Halt the pump."""
     self.backend.halt()
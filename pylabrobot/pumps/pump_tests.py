@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, call
 
 from pylabrobot.pumps import PumpArray
 from pylabrobot.pumps.backend import PumpArrayBackend, PumpBackend
@@ -29,6 +29,40 @@ class TestPump(unittest.IsolatedAsyncioTestCase):
     async with Pump(backend=self.mock_backend) as pump:
       await pump.run_revolutions(num_revolutions=1)
 
+  async def test_pump_volume(self):
+    async with Pump(backend=self.mock_backend, calibration=self.test_calibration) as pump:
+      pump.run_for_duration = AsyncMock()  # type: ignore[method-assign]
+      await pump.pump_volume(speed=1, volume=2)
+      pump.run_for_duration.assert_awaited_once_with(speed=1, duration=2.0)
+
+      assert pump.calibration is not None
+      pump.calibration.calibration_mode = "revolutions"
+      pump.run_revolutions = AsyncMock()  # type: ignore[method-assign]
+      await pump.pump_volume(speed=1, volume=2)
+      pump.run_revolutions.assert_awaited_once_with(num_revolutions=2.0)
+
+  async def test_pump_volumes(self):
+    async with Pump(backend=self.mock_backend, calibration=self.test_calibration) as pump:
+      pump.run_for_duration = AsyncMock()  # type: ignore[method-assign]
+      await pump.pump_volumes(speed=1, volumes=[1, 2.5])
+      pump.run_for_duration.assert_has_awaits(
+        [call(speed=1, duration=1.0), call(speed=1, duration=2.5)]
+      )
+
+      # invalid: nothing is pumped if any volume is negative
+      pump.run_for_duration.reset_mock()
+      with self.assertRaises(ValueError):
+        await pump.pump_volumes(speed=1, volumes=[1, -1])
+      pump.run_for_duration.assert_not_awaited()
+
+      # revolutions mode: run_revolutions does not wait for the pump, so volumes would overlap
+      assert pump.calibration is not None
+      pump.calibration.calibration_mode = "revolutions"
+      pump.run_revolutions = AsyncMock()  # type: ignore[method-assign]
+      with self.assertRaises(ValueError):
+        await pump.pump_volumes(speed=1, volumes=[1, 2.5])
+      pump.run_revolutions.assert_not_awaited()
+
 
 class TestPumpArray(unittest.IsolatedAsyncioTestCase):
   """Tests for the AgrowPumpArrayTester class."""
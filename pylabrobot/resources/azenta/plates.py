@@ -97,6 +97,6 @@ def Azenta4titudeFrameStar_96_wellplate_200ul_Vb_L(name: str, with_lid: bool = F
 def Azenta4titudeFrameStar_96_wellplate_200ul_Vb_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. For portrait, use "
-    "Azenta4titudeFrameStar_96_wellplate_200ul_Vb().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. For portrait, create a "
+    "Azenta4titudeFrameStar_96_wellplate_200ul_Vb(name) and call .rotate(z=90) on it instead."
   )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Generic, List, Optional, Type, TypeVar, Union, cast
+from typing import Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from pylabrobot.resources.resource_holder import ResourceHolder
 
@@ -41,8 +41,9 @@ class Carrier(Resource, Generic[S]):
 
     sites = sites or {}
 
-    self.sites: Dict[int, S] = {}
-    for spot, site in sites.items():
+    self.sites: List[S] = []
+    for spot in sorted(sites):
+      site = sites[spot]
       if site.location is None:
         raise ValueError(f"site {site} has no location")
       self.assign_child_resource(site, location=site.location, spot=spot)
@@ -64,17 +65,23 @@ class Carrier(Resource, Generic[S]):
 
     # see if we have an index for the resource name (eg from deserialization or user specification),
     # otherwise add in first available spot
-    idx = spot or len(self.sites)
-    if not reassign and self.sites[idx] is not None:
-      raise ValueError(f"a site with index {idx} already exists")
-    self.sites[idx] = cast(S, resource)
+    idx = len(self.sites) if spot is None else spot
+    if idx == len(self.sites):
+      self.sites.append(resource)  # type: ignore[arg-type]
+    elif 0 <= idx < len(self.sites):
+      if not reassign:
+        raise ValueError(f"a site with index {idx} already exists")
+      self.sites[idx] = resource  # type: ignore[assignment]
+    else:
+      raise ValueError(f"site index {idx} is out of range, sites must be contiguous from 0")
 
     super().assign_child_resource(resource, location=location, reassign=reassign)
 
   def assign_resource_to_site(self, resource: Resource, spot: int):
-    if self.sites[spot].resource is not None:
+    site = self[spot]
+    if site.resource is not None:
       raise ValueError(f"spot {spot} already has a resource")
-    self.sites[spot].assign_child_resource(resource)
+    site.assign_child_resource(resource)
 
   def unassign_child_resource(self, resource: Resource):
     """Unassign a resource from this carrier, checked by name.
@@ -89,6 +96,8 @@ class Carrier(Resource, Generic[S]):
 
   def __getitem__(self, idx: int) -> S:
     """Get a site by index."""
+    if not 0 <= idx < len(self.sites):
+      raise KeyError(f"site index {idx} is out of range")
     return self.sites[idx]
 
   def __setitem__(self, idx: int, resource: Optional[Resource]):
@@ -108,14 +117,13 @@ class Carrier(Resource, Generic[S]):
 
   def get_resources(self) -> List[Resource]:
     """Get all resources, using self.__getitem__ (so that the location is within this carrier)."""
-    all_resources = [site.resource for site in self.sites.values()]
-    return [resource for resource in all_resources if resource is not None]
+    return [site.resource for site in self.sites if site.resource is not None]
 
   def __eq__(self, other):
     return super().__eq__(other) and self.sites == other.sites
 
   def get_free_sites(self) -> List[S]:
-    return [site for site in self.sites.values() if site.resource is None]
+    return [site for site in self.sites if site.resource is None]
 
 
 class TipCarrier(Carrier):
@@ -178,53 +186,47 @@ class PlateHolder(ResourceHolder):
     location: Optional[Coordinate] = None,
     reassign: bool = True,
   ):
-    if isinstance(resource, ResourceStack):
+    if isinstance(resource, Plate):
+      if resource.plate_type != "skirted":
+        raise ValueError("PlateHolder can only store plates that are skirted")
+    elif isinstance(resource, ResourceStack):
       if not resource.direction == "z":
         raise ValueError("ResourceStack assigned to PlateHolder must have direction 'z'")
-      if not all(isinstance(c, Plate) for c in resource.children):
-        raise TypeError(
-          "If a ResourceStack is assigned to a PlateHolder, the items "
-          + f"must be Plates, not {type(resource.children[-1])}"
-        )
-    elif not isinstance(resource, (Plate, PlateAdapter)):
+      for child in resource.children:
+        if not isinstance(child, Plate):
+          raise TypeError(
+            "If a ResourceStack is assigned to a PlateHolder, the items "
+            + f"must be Plates, not {type(child)}"
+          )
+    elif not isinstance(resource, PlateAdapter):
       raise TypeError(
         "PlateHolder can only store Plate, PlateAdapter or ResourceStack "
         + f"resources, not {type(resource)}"
       )
-    if isinstance(resource, Plate) and resource.plate_type != "skirted":
-      raise ValueError("PlateHolder can only store plates that are skirted")
     return super().assign_child_resource(resource, location, reassign)
 
-  def _get_sinking_depth(self, resource: Resource) -> Coordinate:
-    def get_plate_sinking_depth(plate: Plate):
-      # Sanity check for equal well clearances / dz
-      well_dz_set = {
-        round(well.location.z, 2)
-        for well in plate.get_all_children()
-        if well.category == "well" and well.location is not None
-      }
-      assert len(well_dz_set) == 1, "All wells must have the same z location"
-      well_dz = well_dz_set.pop()
+  def _get_sinking_depth(self, resource: Resource) -> float:
+    """How far (in z, positive) the resource sinks into this holder."""
+
+    def get_plate_sinking_depth(plate: Plate) -> float:
       # Plate "sinking" logic based on well dz to pedestal relationship
-      pedestal_size_z = abs(self.pedestal_size_z)
-      z_sinking_depth = min(pedestal_size_z, well_dz)
-      return z_sinking_depth
+      return min(abs(self.pedestal_size_z), plate._get_well_dz())
 
-    z_sinking_depth = 0.0
     if isinstance(resource, Plate):
-      z_sinking_depth = get_plate_sinking_depth(resource)
-    elif isinstance(resource, ResourceStack) and len(resource.children) > 0:
-      first_child = resource.children[0]
-      if isinstance(first_child, Plate):
-        z_sinking_depth = get_plate_sinking_depth(first_child)
-
+      return get_plate_sinking_depth(resource)
+    if isinstance(resource, ResourceStack) and len(resource.children) > 0:
       # TODO #246 - _get_sinking_depth should not handle callbacks
       resource.register_did_assign_resource_callback(self._update_resource_stack_location)
       self.register_did_unassign_resource_callback(self._deregister_resource_stack_callback)
-    return -Coordinate(z=z_sinking_depth)
+
+      first_child = resource.children[0]
+      if isinstance(first_child, Plate):
+        return get_plate_sinking_depth(first_child)
+    return 0.0
 
   def get_default_child_location(self, resource: Resource) -> Coordinate:
-    return super().get_default_child_location(resource) + self._get_sinking_depth(resource)
+    location = super().get_default_child_location(resource)
+    return Coordinate(location.x, location.y, location.z - self._get_sinking_depth(resource))
 
   def _update_resource_stack_location(self, resource: Resource):
     """Callback called when the lowest resource on a ResourceStack changes. Since the location of
@@ -275,7 +277,7 @@ class PlateCarrier(Carrier):
       category=category,
       model=model,
     )
-    self.sites: Dict[int, PlateHolder] = sites or {}  # fix type
+    self.sites: List[PlateHolder]  # fix type
 
 
 class MFXCarrier(Carrier[ResourceHolder]):
@@ -380,10 +382,7 @@ def create_resources(
   if resource_size_z is None:
     resource_size_z = [0] * len(locations)
 
-  sites = {}
-  for idx, (location, x, y, z) in enumerate(
-    zip(locations, resource_size_x, resource_size_y, resource_size_z)
-  ):
+  def make_site(idx: int, location: Coordinate, x: float, y: float, z: float) -> T:
     site = klass(
       name=f"{name_prefix}-{idx}" if name_prefix else f"{klass.__name__}_{idx}",
       size_x=x,
@@ -392,8 +391,14 @@ def create_resources(
       **kwargs,
     )
     site.location = location
-    sites[idx] = site
-  return sites
+    return site
+
+  return {
+    idx: make_site(idx, location, x, y, z)
+    for idx, (location, x, y, z) in enumerate(
+      zip(locations, resource_size_x, resource_size_y, resource_size_z)
+    )
+  }
 
 
 def create_homogeneous_resources(
@@ -2,22 +2,37 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from pylabrobot.serializer import serialize
 
-@dataclass
+
+@dataclass(init=False)
 class Coordinate:
   """Represents coordinates. This is often used to represent the location of a :class:`~Resource`,
   relative to its parent resource.
   """
 
-  x: float = 0
-  y: float = 0
-  z: float = 0
+  # Decks create many coordinates, so don't give each one a __dict__. `dataclass(slots=True)`
+  # requires Python 3.10, and slots conflict with field defaults, so `__init__` is written out.
+  __slots__ = ("x", "y", "z")
+
+  x: float
+  y: float
+  z: float
 
-  def __post_init__(self):
+  def __init__(self, x: float = 0, y: float = 0, z: float = 0):
     # Round to 4 decimal places to minimize floating point errors (100nm)
-    self.x = round(self.x, 4)
-    self.y = round(self.y, 4)
-    self.z = round(self.z, 4)
+    self.x = round(x, 4)
+    self.y = round(y, 4)
+    self.z = round(z, 4)
+
+  def serialize(self) -> dict:
+    # without a __dict__, the generic object serialization does not apply
+    return {
+      "x": serialize(self.x),
+      "y": serialize(self.y),
+      "z": serialize(self.z),
+      "type": "Coordinate",
+    }
 
   @staticmethod
   def zero() -> Coordinate:
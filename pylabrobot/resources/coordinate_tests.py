@@ -32,3 +32,7 @@ class TestCoordinate(unittest.TestCase):
   def test_unpacking(self):
     x, y, z = self.a
     self.assertEqual((x, y, z), (1, 2, 3))
+
+  def test_rounding(self):
+    self.assertEqual(Coordinate(1.23456, y=2.00004), Coordinate(1.2346, 2, 0))
+    self.assertEqual(Coordinate(), self.c)
@@ -69,5 +69,6 @@ def Axy_24_DW_10ML_L(name: str, with_lid: bool = False) -> Plate:
 def Axy_24_DW_10ML_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "Axy_24_DW_10ML().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Axy_24_DW_10ML(name) and call .rotate(z=90) on it instead."
   )
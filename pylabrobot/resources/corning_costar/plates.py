@@ -103,8 +103,8 @@ def Cos_6_wellplate_16800ul_Fb_L(name: str, with_lid: bool = True) -> Plate:
 def Cos_6_wellplate_16800ul_Fb_P(name: str, with_lid: bool = True) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use "
-    "Cos_6_wellplate_16800ul_Fb().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Cos_6_wellplate_16800ul_Fb(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -347,7 +347,8 @@ def Cos_96_wellplate_2mL_Vb_L(name: str, with_lid: bool = False) -> Plate:
 def Cos_96_wellplate_2mL_Vb_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "Cos_96_wellplate_2mL_Vb().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Cos_96_wellplate_2mL_Vb(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -110,6 +110,6 @@ def Eppendorf_96_wellplate_250ul_Vb_L(name: str, with_lid: bool = False) -> Plat
 def Eppendorf_96_wellplate_250ul_Vb_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use "
-    "Eppendorf_96_wellplate_250ul_Vb.rotated(90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Eppendorf_96_wellplate_250ul_Vb(name) and call .rotate(z=90) on it instead."
   )
@@ -1,6 +1,7 @@
 import textwrap
 import unittest
 
+from pylabrobot.resources import Coordinate, Resource
 from pylabrobot.resources.corning_costar import (
   Cor_96_wellplate_360ul_Fb,
 )
@@ -11,6 +12,7 @@ from pylabrobot.resources.hamilton import (
   TIP_CAR_480_A00,
   STARLetDeck,
 )
+from pylabrobot.resources.hamilton.hamilton_decks import _rails_for_x_coordinate
 from pylabrobot.resources.stanley.cups import (
   StanleyCup_QUENCHER_FLOWSTATE_TUMBLER,
 )
@@ -84,3 +86,45 @@ class HamiltonDeckTests(unittest.TestCase):
         "careful when grabbing this resource.",
       ],
     )
+
+  def test_collision_after_unassign(self):
+    deck = self.build_layout()
+    plt_car = deck.get_resource("plate carrier")
+    with self.assertRaises(ValueError):
+      deck.assign_child_resource(PLT_CAR_L5AC_A00(name="other carrier"), rails=22)
+    deck.unassign_child_resource(plt_car)
+    deck.assign_child_resource(PLT_CAR_L5AC_A00(name="other carrier"), rails=22)
+
+  def test_collision_containing_resource(self):
+    deck = STARLetDeck()
+    deck.assign_child_resource(
+      Resource("small", size_x=10, size_y=10, size_z=10), location=Coordinate(205, 105, 0)
+    )
+    with self.assertRaises(ValueError):
+      deck.assign_child_resource(
+        Resource("big", size_x=100, size_y=100, size_z=10), location=Coordinate(200, 100, 0)
+      )
+    deck.assign_child_resource(
+      Resource("adjacent", size_x=100, size_y=100, size_z=10), location=Coordinate(215, 100, 0)
+    )
+
+  def test_rails_for_x_coordinate(self):
+    for rails in range(1, 56):
+      x = 100 + (rails - 1) * 22.5
+      self.assertEqual(_rails_for_x_coordinate(x), rails)
+      self.assertEqual(_rails_for_x_coordinate(x + 22.4), rails)
+    self.assertEqual(_rails_for_x_coordinate(100 + 0.1 + 0.2 - 0.3 + 22.5 * 3), 4)
+    self.assertEqual(_rails_for_x_coordinate(-58.2), -6)
+
+  def test_collision_after_move(self):
+    deck = STARLetDeck()
+    a = Resource("a", size_x=100, size_y=100, size_z=10)
+    deck.assign_child_resource(a, location=Coordinate(100, 100, 0))
+    a.location = Coordinate(600, 100, 0)
+    deck.assign_child_resource(
+      Resource("b", size_x=100, size_y=100, size_z=10), location=Coordinate(100, 100, 0)
+    )
+    with self.assertRaises(ValueError):
+      deck.assign_child_resource(
+        Resource("c", size_x=100, size_y=100, size_z=10), location=Coordinate(620, 120, 0)
+      )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+import operator
 from abc import ABCMeta, abstractmethod
-from typing import Optional, cast
+from typing import List, Optional, Tuple, cast
 
 from pylabrobot.resources.carrier import ResourceHolder
 from pylabrobot.resources.coordinate import Coordinate
@@ -17,6 +18,7 @@ logger = logging.getLogger("pylabrobot")
 
 
 _RAILS_WIDTH = 22.5  # space between rails (mm)
+_RAILS_WIDTH_UM10 = 225_000  # _RAILS_WIDTH in units of 0.1 um
 
 STARLET_NUM_RAILS = 32
 STARLET_SIZE_X = 1360
@@ -31,7 +33,11 @@ STAR_SIZE_Z = 900
 
 def _rails_for_x_coordinate(x: float) -> int:
   """Convert an x coordinate to a rail identifier."""
-  return int((x - 100.0) / _RAILS_WIDTH) + 1
+  # Coordinates are rounded to 4 decimals, so compute in integer units of 0.1 um. This avoids
+  # floating point error right at a rail boundary. Truncate towards zero, like int().
+  offset = round((x - 100.0) * 10_000)
+  rails_offset = abs(offset) // _RAILS_WIDTH_UM10
+  return (rails_offset if offset >= 0 else -rails_offset) + 1
 
 
 class HamiltonDeck(Deck, metaclass=ABCMeta):
@@ -56,6 +62,8 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
       origin=origin,
     )
     self.num_rails = num_rails
+    # x coordinate of the right edge of the last rail, constant for the deck
+    self._rails_right_x = self.rails_to_location(self.num_rails + 1).x
     self.register_did_assign_resource_callback(self._check_safe_z_height)
 
   @abstractmethod
@@ -169,37 +177,26 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
 
     if not ignore_collision:
       if resource_location is not None:  # collision detection
-        if (
-          resource_location.x + resource.get_absolute_size_x()
-          > self.rails_to_location(self.num_rails + 1).x
-          and rails is not None
-        ):
-          raise ValueError(
-            f"Resource with width {resource.get_absolute_size_x()} does not fit at rails {rails}."
-          )
-
-        # Check if there is space for this new resource.
+        size_x = resource.get_absolute_size_x()
+        x0, y0 = resource_location.x, resource_location.y
+        x1 = x0 + size_x
+        y1 = y0 + resource.get_absolute_size_y()
+
+        if rails is not None and x1 > self._rails_right_x:
+          raise ValueError(f"Resource with width {size_x} does not fit at rails {rails}.")
+
+        # Check if there is space for this new resource. Locations and sizes are read at check time,
+        # because children may have been moved or rotated since they were assigned.
         for og_resource in self.children:
-          og_x = cast(Coordinate, og_resource.location).x
-          og_y = cast(Coordinate, og_resource.location).y
-
-          # A resource is not allowed to overlap with another resource. Resources overlap when a
-          # corner of one resource is inside the boundaries of another resource.
-          if any(
-            [
-              og_x <= resource_location.x < og_x + og_resource.get_absolute_size_x(),
-              og_x
-              < resource_location.x + resource.get_absolute_size_x()
-              < og_x + og_resource.get_absolute_size_x(),
-            ]
-          ) and any(
-            [
-              og_y <= resource_location.y < og_y + og_resource.get_absolute_size_y(),
-              og_y
-              < resource_location.y + resource.get_absolute_size_y()
-              < og_y + og_resource.get_absolute_size_y(),
-            ]
-          ):
+          og_location = cast(Coordinate, og_resource.location)
+          og_x0, og_y0 = og_location.x, og_location.y
+          og_x1 = og_x0 + og_resource.get_absolute_size_x()
+          og_y1 = og_y0 + og_resource.get_absolute_size_y()
+
+          # A resource is not allowed to overlap with another resource. Resources overlap when
+          # their footprints intersect with a positive area, so touching edges and zero-width
+          # resources (like the trash) do not count.
+          if min(x1, og_x1) > max(x0, og_x0) and min(y1, og_y1) > max(y0, og_y0):
             raise ValueError(
               f"Location {resource_location} is already occupied by resource "
               f"'{og_resource.name}'."
@@ -235,117 +232,97 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
       "plate_holder",
     }
 
-    def find_longest_child_name(resource: Resource, depth=0, depth_weight=4):
-      """DFS to find longest child name, and depth of that child, excluding excluded categories"""
-      longest, longest_depth = (
-        (len(resource.name), depth) if resource.category not in exclude_categories else (0, 0)
-      )
-      new_depth = depth + 1 if resource.category not in exclude_categories else depth
-      return max(
-        [(longest + longest_depth * depth_weight)]
-        + [find_longest_child_name(c, new_depth) for c in resource.children]
-      )
-
-    def find_longest_type_name(resource: Resource):
-      """DFS to find the longest type name"""
-      longest = (
-        len(resource.__class__.__name__) if resource.category not in exclude_categories else 0
-      )
-      return max([longest] + [find_longest_type_name(child) for child in resource.children])
-
-    # Calculate the maximum lengths of the resource name and type for proper alignment
-    max_name_length = find_longest_child_name(self)
-    max_type_length = find_longest_type_name(self)
+    # Calculate the maximum lengths of the resource name (indented 4 per depth) and type for
+    # proper alignment, in a single iterative DFS. Depth only increases for printed resources.
+    max_name_length = max_type_length = 0
+    stack: List[Tuple[Resource, int]] = [(self, 0)]
+    while len(stack) > 0:
+      resource, depth = stack.pop()
+      if resource.category not in exclude_categories:
+        max_name_length = max(max_name_length, len(resource.name) + depth * 4)
+        max_type_length = max(max_type_length, len(resource.__class__.__name__))
+        depth += 1
+      stack.extend((child, depth) for child in resource.children)
 
     # Find column lengths
     rail_column_length = 6
-    name_column_length = max(
-      max_name_length + 4, 30
-    )  # 4 per depth (by find_longest_child), 4 extra
+    # max_name_length already includes 4 per depth (from the traversal above), plus 4 extra
+    name_column_length = max(max_name_length + 4, 30)
     type_column_length = max_type_length + 3 - 4
     location_column_length = 30
 
+    # Lines of the summary, with trailing whitespace truncated. Joined once at the end.
+    lines: List[str] = []
+
+    def add_line(line: str):
+      lines.append(line.rstrip())
+
     # Print header
-    summary_ = (
+    add_line(
       "Rail".ljust(rail_column_length)
       + "Resource".ljust(name_column_length)
       + "Type".ljust(type_column_length)
       + "Coordinates (mm)".ljust(location_column_length)
-      + "\n"
     )
     total_length = (
       rail_column_length + name_column_length + type_column_length + location_column_length
     )
-    summary_ += "=" * total_length + "\n"
+    add_line("=" * total_length)
 
     def make_tree_part(depth: int) -> str:
-      tree_part = "├── "
-      for _ in range(depth):
-        tree_part = "│   " + tree_part
-      return tree_part
+      return "│   " * depth + "├── "
 
-    def print_empty_spot_line(depth=0) -> str:
-      r_summary = " " * rail_column_length
+    def print_empty_spot_line(depth=0):
       tree_part = make_tree_part(depth)
-      r_summary += (tree_part + "<empty>").ljust(name_column_length)
-      return r_summary
-
-    def print_resource_line(resource: Resource, depth=0) -> str:
-      r_summary = ""
+      add_line(" " * rail_column_length + (tree_part + "<empty>").ljust(name_column_length))
 
+    def print_resource_line(resource: Resource, depth=0):
       # Print rail
       if depth == 0:
-        rails = _rails_for_x_coordinate(resource.get_absolute_location().x)
-        r_summary += f"({rails})".ljust(rail_column_length)
+        rail_part = f"({rails_by_child[resource.name]})".ljust(rail_column_length)
       else:
-        r_summary += " " * rail_column_length
-
-      # Print resource name
-      tree_part = make_tree_part(depth)
-      r_summary += (tree_part + resource.name).ljust(name_column_length)
-
-      # Print resource type
-      r_summary += resource.__class__.__name__.ljust(type_column_length)
+        rail_part = " " * rail_column_length
 
       # Print resource location
       try:
         location = str(resource.get_absolute_location())
       except NoLocationError:
         location = "Undefined"
-      r_summary += location.ljust(location_column_length)
 
-      return r_summary
+      add_line(
+        rail_part
+        + (make_tree_part(depth) + resource.name).ljust(name_column_length)
+        + resource.__class__.__name__.ljust(type_column_length)
+        + location.ljust(location_column_length)
+      )
 
     def print_tree(resource: Resource, depth=0):
-      r_summary = print_resource_line(resource, depth=depth)
+      print_resource_line(resource, depth=depth)
 
       for child in resource.children:
         if isinstance(child, ResourceHolder):
-          r_summary += "\n"
           if child.resource is not None:
-            r_summary += print_tree(child.resource, depth=depth + 1)
+            print_tree(child.resource, depth=depth + 1)
           else:
-            r_summary += print_empty_spot_line(depth=depth + 1)
+            print_empty_spot_line(depth=depth + 1)
         elif child.category not in exclude_categories:
-          r_summary += "\n"
-          r_summary += print_tree(child, depth=depth + 1)
+          print_tree(child, depth=depth + 1)
 
-      return r_summary
+    # Absolute x of the top level resources, computed once for both the rails and the sorting.
+    xs = [(r.get_absolute_location().x, r) for r in self.children]
+    rails_by_child = {r.name: _rails_for_x_coordinate(x) for x, r in xs}
 
     # Sort resources by rails, left to right in reality.
-    sorted_resources = sorted(self.children, key=lambda r: r.get_absolute_location().x)
+    xs.sort(key=operator.itemgetter(0))
+    sorted_resources = [r for _, r in xs]
 
     # Print table body.
-    summary_ += print_tree(sorted_resources[0]) + "\n"
+    print_tree(sorted_resources[0])
     for resource in sorted_resources[1:]:
-      summary_ += "      │\n"
-      summary_ += print_tree(resource)
-      summary_ += "\n"
-
-    # Truncate trailing whitespace from each line
-    summary_ = "\n".join([line.rstrip() for line in summary_.split("\n")])
+      add_line("      │")
+      print_tree(resource)
 
-    return summary_
+    return "\n".join(lines) + "\n"
 
 
 class HamiltonSTARDeck(HamiltonDeck):
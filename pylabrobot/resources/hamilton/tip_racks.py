@@ -55,7 +55,8 @@ def FourmlTF_L(name: str, with_tips: bool = True) -> TipRack:
 def FourmlTF_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "FourmlTF().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "FourmlTF(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -92,7 +93,8 @@ def FivemlT_L(name: str, with_tips: bool = True) -> TipRack:
 def FivemlT_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "FivemlT().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "FivemlT(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -129,7 +131,8 @@ def HTF_L(name: str, with_tips: bool = True) -> TipRack:
 def HTF_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "HTF().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "HTF(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -224,7 +227,8 @@ def HT_L(name: str, with_tips: bool = True) -> TipRack:
 def HT_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "HT().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "HT(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -261,7 +265,8 @@ def LTF_L(name: str, with_tips: bool = True) -> TipRack:
 def LTF_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "LTF().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "LTF(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -298,7 +303,8 @@ def LT_L(name: str, with_tips: bool = True) -> TipRack:
 def LT_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "LT().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "LT(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -335,7 +341,8 @@ def STF_L(name: str, with_tips: bool = True) -> TipRack:
 def STF_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "STF().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "STF(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -372,7 +379,8 @@ def STF_Slim_L(name: str, with_tips: bool = True) -> TipRack:
 def STF_Slim_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "STF_Slim().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "STF_Slim(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -409,7 +417,8 @@ def ST_L(name: str, with_tips: bool = True) -> TipRack:
 def ST_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "ST().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "ST(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -448,7 +457,8 @@ def TIP_50ul_w_filter_L(name: str, with_tips: bool = True) -> TipRack:
 def TIP_50ul_w_filter_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "TIP_50ul_w_filter().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "TIP_50ul_w_filter(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -485,7 +495,8 @@ def TIP_50ul_L(name: str, with_tips: bool = True) -> TipRack:
 def TIP_50ul_P(name: str, with_tips: bool = True) -> TipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "TIP_50ul().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "TIP_50ul(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -526,6 +537,6 @@ def Hamilton_96_tiprack_50ul_NTR_L(name: str, with_tips: bool = True) -> NestedT
 def Hamilton_96_tiprack_50ul_NTR_P(name: str, with_tips: bool = True) -> NestedTipRack:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use "
-    "Hamilton_96_tiprack_50ul_NTR().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Hamilton_96_tiprack_50ul_NTR(name) and call .rotate(z=90) on it instead."
   )
@@ -2,13 +2,19 @@
 
 import math
 
+# pi multiples shared by the cone and (hemi)sphere volume formulas. Plain (1 / 3) is left inline,
+# where the compiler folds it into a constant.
+_ONE_THIRD_PI = math.pi / 3
+_TWO_THIRDS_PI = 2 * math.pi / 3
+
 
 def _height_of_volume_in_spherical_cap(r: float, liquid_volume: float) -> float:
   """Calculate the height of liquid in a spherical cap given the radius of the sphere and the
   volume of the liquid.
 
-  This function uses binary search to determine the height of the liquid within a spherical cap
-  (a portion of a sphere).
+  The cap volume V = pi * h^2 * (3r - h) / 3 is a cubic in h. Substituting u = r - h gives the
+  depressed cubic u^3 - 3r^2 u + (2r^3 - 3V/pi) = 0, whose root in [0, r] is found in closed form
+  with the trigonometric (Viete) solution.
 
   Parameters:
     r: The radius of the sphere in millimeters.
@@ -23,32 +29,26 @@ def _height_of_volume_in_spherical_cap(r: float, liquid_volume: float) -> float:
   Example:
     >>> _height_of_volume_in_spherical_cap(6.9, 100)
     2.28 # units: mm
-
-  Notes:
-    - The height is calculated with a precision defined by the tolerance value (1e-6).
   """
 
-  def volume_of_spherical_cap(h: float):
-    return (1 / 3) * math.pi * h**2 * (3 * r - h)
+  # An empty cap holds no liquid. For r == 0 this also avoids dividing by zero below: any positive
+  # volume exceeds max_volume == 0 and raises first.
+  if liquid_volume <= 0:
+    return 0.0
 
   # Maximum volume of the spherical cap with height equal to the radius
-  max_volume = volume_of_spherical_cap(r)
+  max_volume = _TWO_THIRDS_PI * r**3
   if liquid_volume > max_volume:
     raise ValueError(
       """WARNING: Liquid volume exceeds the volume of a
                          hemisphere of the given radius."""
     )
 
-  # Binary search to solve for h
-  low, high = 0.0, r
-  tolerance = 1e-6
-  while high - low > tolerance:
-    mid = (low + high) / 2
-    if volume_of_spherical_cap(mid) < liquid_volume:
-      low = mid
-    else:
-      high = mid
-  liquid_height = (low + high) / 2
+  # cos(3 * theta) for the depressed cubic, in [-1, 0] for volumes up to a hemisphere. Clamp to
+  # guard against rounding just outside the domain of acos.
+  cos_3theta = max(-1.0, min(1.0, liquid_volume / max_volume - 1))
+  u = 2 * r * math.cos(math.acos(cos_3theta) / 3 - _TWO_THIRDS_PI)
+  liquid_height = min(max(r - u, 0.0), r)
 
   return liquid_height
 
@@ -170,7 +170,7 @@ def calculate_liquid_height_in_container_2segments_square_ubottom(
     The height of the liquid in the container in mm.
   """
   r = x / 2  # Radius of the hemisphere
-  full_hemisphere_volume = (2 / 3) * math.pi * r**3
+  full_hemisphere_volume = _TWO_THIRDS_PI * r**3
 
   if liquid_volume <= full_hemisphere_volume:
     # Liquid volume is within the hemisphere
@@ -214,13 +214,13 @@ def calculate_liquid_volume_container_2segments_square_ubottom(
     )
 
   r = x / 2  # Radius of the hemisphere
-  full_hemisphere_volume = (2 / 3) * math.pi * r**3
+  full_hemisphere_volume = _TWO_THIRDS_PI * r**3
 
   if liquid_height <= r:
     # Liquid height is within the hemisphere
     # Calculating the sub-volume of the hemisphere using spherical cap volume formula
     h = liquid_height  # Height of the spherical cap
-    liquid_volume = (1 / 3) * math.pi * h**2 * (3 * r - h)
+    liquid_volume = _ONE_THIRD_PI * h**2 * (3 * r - h)
   else:
     # Liquid height extends into the cuboid
     # Calculating the volume of the cuboid portion filled with liquid
@@ -303,7 +303,7 @@ def calculate_liquid_volume_container_2segments_round_vbottom(
 
   r = d / 2
   # Calculating the full volume of the cone
-  full_cone_volume = (1 / 3) * math.pi * r**2 * h_cone
+  full_cone_volume = _ONE_THIRD_PI * r**2 * h_cone
 
   if liquid_height <= h_cone:
     # Liquid height is within the cone
@@ -339,7 +339,7 @@ def calculate_liquid_height_in_container_2segments_round_ubottom(
   """
 
   radius = d / 2
-  hemisphere_volume = (2 / 3) * math.pi * (radius**3)
+  hemisphere_volume = _TWO_THIRDS_PI * (radius**3)
   base_area = math.pi * (radius**2)
 
   # Calculate total container volume
@@ -390,13 +390,13 @@ def calculate_liquid_volume_container_2segments_round_ubottom(
     )
 
   # Calculating the full volume of the hemisphere
-  full_hemisphere_volume = (2 / 3) * math.pi * r**3
+  full_hemisphere_volume = _TWO_THIRDS_PI * r**3
 
   if liquid_height <= r:
     # Liquid height is within the hemisphere
     # Calculating the sub-volume of the hemisphere using spherical cap volume formula
     h = liquid_height  # Height of the spherical cap
-    liquid_volume = (1 / 3) * math.pi * h**2 * (3 * r - h)
+    liquid_volume = _ONE_THIRD_PI * h**2 * (3 * r - h)
   else:
     # Liquid height extends into the cylinder
     # Calculating the volume of the cylinder portion filled with liquid
@@ -491,10 +491,7 @@ def compute_volume_from_height_conical_frustum(
 ) -> float:
   """Compute volume (uL) from height (mm) for a conical frustum."""
   return (
-    (1 / 3)
-    * math.pi
-    * liquid_height
-    * (bottom_radius**2 + bottom_radius * top_radius + top_radius**2)
+    _ONE_THIRD_PI * liquid_height * (bottom_radius**2 + bottom_radius * top_radius + top_radius**2)
   )
 
 
@@ -0,0 +1,41 @@
+import math
+import unittest
+
+from pylabrobot.resources.height_volume_functions import (
+  _height_of_volume_in_spherical_cap,
+  calculate_liquid_height_in_container_2segments_round_ubottom,
+  calculate_liquid_volume_container_2segments_round_ubottom,
+)
+
+
+class HeightVolumeFunctionsTests(unittest.TestCase):
+  def test_height_of_volume_in_spherical_cap(self):
+    self.assertAlmostEqual(_height_of_volume_in_spherical_cap(r=6.9, liquid_volume=100), 2.2767, 4)
+    self.assertEqual(_height_of_volume_in_spherical_cap(r=4, liquid_volume=0), 0)
+    self.assertEqual(_height_of_volume_in_spherical_cap(r=0, liquid_volume=0), 0)
+    with self.assertRaises(ValueError):
+      _height_of_volume_in_spherical_cap(r=0, liquid_volume=5)
+    self.assertEqual(
+      calculate_liquid_height_in_container_2segments_round_ubottom(
+        d=0, h_cylinder=10, liquid_volume=0
+      ),
+      0,
+    )
+    hemisphere_volume = (2 / 3) * math.pi * 4**3
+    self.assertAlmostEqual(
+      _height_of_volume_in_spherical_cap(r=4, liquid_volume=hemisphere_volume), 4
+    )
+    with self.assertRaises(ValueError):
+      _height_of_volume_in_spherical_cap(r=4, liquid_volume=hemisphere_volume + 1)
+
+  def test_round_ubottom_round_trip(self):
+    for liquid_height in [0.1, 1, 3.4, 6, 12]:
+      volume = calculate_liquid_volume_container_2segments_round_ubottom(
+        d=8, h_cylinder=10, liquid_height=liquid_height
+      )
+      self.assertAlmostEqual(
+        calculate_liquid_height_in_container_2segments_round_ubottom(
+          d=8, h_cylinder=10, liquid_volume=volume
+        ),
+        liquid_height,
+      )
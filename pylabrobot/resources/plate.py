@@ -101,6 +101,7 @@ class Plate(ItemizedResource["Well"]):
     )
     self._lid: Optional[Lid] = None
     self.plate_type = plate_type
+    self._cached_well_dz: Optional[float] = None
 
     if lid is not None:
       self.assign_child_resource(lid)
@@ -134,13 +135,31 @@ class Plate(ItemizedResource["Well"]):
       location = location or default_location
     else:
       assert location is not None, "Location must be specified for if resource is not a lid."
+    self._cached_well_dz = None
     return super().assign_child_resource(resource, location=location, reassign=reassign)
 
   def unassign_child_resource(self, resource):
     if isinstance(resource, Lid) and resource == self.lid:
       self._lid = None
+    self._cached_well_dz = None
     return super().unassign_child_resource(resource)
 
+  def _get_well_dz(self) -> float:
+    """Get the z location of the wells relative to the plate. All wells must have the same z.
+
+    The result is cached until a child is assigned to or unassigned from this plate.
+    """
+
+    if self._cached_well_dz is None:
+      well_dz_set = {
+        round(well.location.z, 2)
+        for well in self.get_all_children()
+        if well.category == "well" and well.location is not None
+      }
+      assert len(well_dz_set) == 1, "All wells must have the same z location"
+      self._cached_well_dz = well_dz_set.pop()
+    return self._cached_well_dz
+
   def __repr__(self) -> str:
     return (
       f"{self.__class__.__name__}(name={self.name}, size_x={self._size_x}, "
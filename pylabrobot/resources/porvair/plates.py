@@ -103,7 +103,8 @@ def Porvair_6_reservoir_47ml_Vb_L(name: str, with_lid: bool = False) -> Plate:
 def Porvair_6_reservoir_47ml_Vb_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use " "Porvair_6_reservoir_47ml_Vb.rotated(90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Porvair_6_reservoir_47ml_Vb(name) and call .rotate(z=90) on it instead."
   )
 
 
@@ -169,7 +169,7 @@ class TecanDeck(Deck):
       )
 
       if isinstance(resource, Carrier):
-        for site in resource.sites.values():
+        for site in resource.sites:
           if site.resource is None:
             r_summary += "     │   ├── <empty>\n"
           else:
@@ -126,21 +126,25 @@ def Thermo_TS_96_wellplate_1200ul_Rb_L(name: str, with_lid: bool = False) -> Pla
 def Thermo_TS_96_wellplate_1200ul_Rb_P(name: str, with_lid: bool = False) -> Plate:
   # https://github.com/PyLabRobot/pylabrobot/issues/252
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use "
-    "Thermo_TS_96_wellplate_1200ul_Rb().rotated(z=90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Thermo_TS_96_wellplate_1200ul_Rb(name) and call .rotate(z=90) on it instead."
   )
 
 
 # # # # # # # # # # Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate # # # # # # # # # #
 
 
+# The fitted polynomials below are evaluated in Horner form, e.g.
+# 0.9617 + 10.2590 * h - 1.3069 * h**2 + 0.26799 * h**3 - 0.01003 * h**4 for the volume.
+
+
 def _compute_volume_from_height_Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate(
   h: float,
 ):
   if h > 21.1:
-    raise ValueError(f"Height {h} is too large for" + "ThermoScientific_96_wellplate_1200ul_Rd")
+    raise ValueError(f"Height {h} is too large for Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate")
   return max(
-    0.9617 + 10.2590 * h - 1.3069 * h**2 + 0.26799 * h**3 - 0.01003 * h**4,
+    0.9617 + h * (10.2590 + h * (-1.3069 + h * (0.26799 + h * -0.01003))),
     0,
   )
 
@@ -150,14 +154,11 @@ def _compute_height_from_volume_Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate(
 ):
   if liquid_volume > 315:  # 5% tolerance
     raise ValueError(
-      f"Volume {liquid_volume} is too large for" + "ThermoScientific_96_wellplate_1200ul_Rd"
+      f"Volume {liquid_volume} is too large for Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate"
     )
+  v = liquid_volume
   return max(
-    -0.1823
-    + 0.1327 * liquid_volume
-    - 0.000637 * liquid_volume**2
-    + 1.6577e-6 * liquid_volume**3
-    - 1.1487e-9 * liquid_volume**4,
+    -0.1823 + v * (0.1327 + v * (-0.000637 + v * (1.6577e-6 + v * -1.1487e-9))),
     0,
   )
 
@@ -239,6 +240,6 @@ def Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate_L(name: str, with_lid: bool = Fa
 
 def Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate_P(name: str, with_lid: bool = False) -> Plate:
   raise NotImplementedError(
-    "_L and _P definitions are deprecated. Use "
-    "Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate.rotated(90) instead."
+    "_L and _P definitions are deprecated. Create a "
+    "Thermo_AB_96_wellplate_300ul_Vb_EnduraPlate(name) and call .rotate(z=90) on it instead."
   )
@@ -20,8 +20,9 @@ def get_plr_class_from_string(klass_type: str):
   import pylabrobot.liquid_handling as lh_module
   import pylabrobot.resources as resource_module
 
-  for name, obj in inspect.getmembers(resource_module) + inspect.getmembers(lh_module):
-    if inspect.isclass(obj) and name == klass_type:
+  for module in (resource_module, lh_module):
+    obj = vars(module).get(klass_type)
+    if inspect.isclass(obj):
       return obj
   raise ValueError(f"Could not find class {klass_type}")
 
@@ -1,34 +1,71 @@
 """Utilities for parsing Hamilton files (.lay, .tml, .ctr, .rck).
 
 All are based on the seemingly arbitrary use of ascii escape characters.
+
+The content `c` may be passed as `str` or as the raw `bytes` of the file. For bytes, only the
+matched values are decoded (as latin-1), so the file does not have to be decoded as a whole.
 """
 
-import itertools
+import functools
+import re
+from typing import Iterator, Pattern, Union
+
+# Keys and values are separated by ascii control characters (0x00-0x1f).
+_CONTROL_CHARS = "\x00-\x1f"
+
+_STR_VALUE_RE = re.compile(f"[^{_CONTROL_CHARS}]*")
+_BYTES_VALUE_RE = re.compile(_STR_VALUE_RE.pattern.encode("latin-1"))
+
+
+@functools.lru_cache(maxsize=512)
+def _key_pattern(key: str, binary: bool) -> Pattern:
+  """Compiled pattern matching `key` delimited by control characters, capturing the value.
+
+  Keys are per-labware (`Labware.{i}.Id`, ...), so the cache is bounded."""
+  pattern = f"[{_CONTROL_CHARS}]{re.escape(key)}[{_CONTROL_CHARS}]([^{_CONTROL_CHARS}]*)"
+  return re.compile(pattern.encode("latin-1")) if binary else re.compile(pattern)
+
+
+def _find_values(key: str, c: Union[str, bytes]) -> Iterator[str]:
+  """Yield the values of all occurrences of `key` that are delimited by control characters, in the
+  order they appear in `c`. The whole content is scanned once."""
+  if isinstance(c, bytes):
+    for bytes_match in _key_pattern(key, True).finditer(c):
+      yield bytes_match.group(1).decode("latin-1")
+  else:
+    for str_match in _key_pattern(key, False).finditer(c):
+      yield str_match.group(1)
 
 
 def find_int(key, c):
-  for i, j, k in itertools.product(range(16 * 2), range(16 * 2), range(16 * 2)):
+  for value in _find_values(key, c):
     try:
-      return int(c.split(chr(i) + key + chr(j))[1].split(chr(k))[0])
-    except (IndexError, ValueError):
+      return int(value)
+    except ValueError:
       continue
   raise ValueError(f"Could not find '{key}'")
 
 
 def find_float(key, c):
-  for i, j, k in itertools.product(range(16 * 2), range(16 * 2), range(16 * 2)):
+  for value in _find_values(key, c):
     try:
-      return float(c.split(chr(i) + key + chr(j))[1].split(chr(k))[0])
-    except (IndexError, ValueError):
+      return float(value)
+    except ValueError:
       continue
   raise ValueError(f"Could not find '{key}'")
 
 
 def find_string(key, c):
-  finds = []
-  for i in range(32):
-    try:
-      finds.append(c.split(key)[1][1:].split(chr(i))[0])
-    except (IndexError, ValueError):
-      continue
-  return min(finds, key=len)
+  binary = isinstance(c, bytes)
+  start = c.find(key.encode("latin-1") if binary else key)
+  if start == -1:
+    raise ValueError(f"Could not find '{key}'")
+  # skip the separator following the key, the value runs until the next control character
+  end = start + len(key) + 1
+  if binary:
+    bytes_match = _BYTES_VALUE_RE.match(c, end)
+    assert bytes_match is not None  # `*` always matches
+    return bytes_match.group().decode("latin-1")
+  str_match = _STR_VALUE_RE.match(c, end)
+  assert str_match is not None
+  return str_match.group()
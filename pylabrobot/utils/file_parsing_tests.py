@@ -0,0 +1,35 @@
+"""Tests for file parsing"""
+
+import unittest
+
+from pylabrobot.utils.file_parsing import find_float, find_int, find_string
+
+
+class TestFileParsing(unittest.TestCase):
+  """Tests for Hamilton file parsing utilities."""
+
+  content = (
+    "\x04Labware.Cnt\x0112\x02Labware.1.File\x01ML_STAR\\PLT_CAR_L5AC.tml\x03"
+    "Dim.Dx\x02abc\x05Dim.Dx\x06127.76\x07Dim.Dy\x0185.48"
+  )
+
+  def test_find_int(self):
+    self.assertEqual(find_int("Labware.Cnt", self.content), 12)
+    with self.assertRaises(ValueError):
+      find_int("Labware.Missing", self.content)
+
+  def test_find_float(self):
+    # the first occurrence of Dim.Dx is not a number, so the second one is used
+    self.assertEqual(find_float("Dim.Dx", self.content), 127.76)
+    self.assertEqual(find_float("Dim.Dy", self.content), 85.48)
+
+  def test_find_string(self):
+    self.assertEqual(find_string("Labware.1.File", self.content), "ML_STAR\\PLT_CAR_L5AC.tml")
+    with self.assertRaises(ValueError):
+      find_string("Labware.Missing", self.content)
+
+  def test_bytes_content(self):
+    content = self.content.encode("latin-1")
+    self.assertEqual(find_int("Labware.Cnt", content), 12)
+    self.assertEqual(find_float("Dim.Dx", content), 127.76)
+    self.assertEqual(find_string("Labware.1.File", content), "ML_STAR\\PLT_CAR_L5AC.tml")